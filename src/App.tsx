@@ -9,6 +9,31 @@ import { generateInsights, getAttributeLabel } from './utils/insights';
 import { CombinedData, AttributeKey, DataTypeFilter } from './types';
 import { Loader2 } from 'lucide-react';
 
+// loadCSVData returns rows sorted by datetime, so a date range is a
+// contiguous slice we can locate by binary search instead of scanning
+// and comparing every row on each filter change
+const lowerBound = (data: CombinedData[], time: number): number => {
+  let lo = 0;
+  let hi = data.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (data[mid].datetime.getTime() < time) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+const upperBound = (data: CombinedData[], time: number): number => {
+  let lo = 0;
+  let hi = data.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (data[mid].datetime.getTime() <= time) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
 function App() {
   const [data, setData] = useState<CombinedData[]>([]);
   const [loading, setLoading] = useState(true);
@@ -55,20 +80,32 @@ function App() {
     return attributes;
   }, [data]);
 
-  // Filter data based on current selections
-  const filteredData = useMemo(() => {
-    return data.filter(d => {
-      const dateInRange = d.datetime >= dateRange.start && d.datetime <= dateRange.end;
-      const hasAttribute = d[selectedAttribute] !== undefined && d[selectedAttribute] !== null;
-      const matchesDataType = dataTypeFilter === 'Both' || d.dataType === dataTypeFilter;
-      
-      return dateInRange && hasAttribute && matchesDataType;
-    });
-  }, [data, dateRange, selectedAttribute, dataTypeFilter]);
+  // Partition the date-range slice into its historical and predicted
+  // halves once, so the charts and insights can dispatch on the data
+  // type filter directly instead of re-scanning for dataType
+  const { filteredHistorical, filteredPredicted } = useMemo(() => {
+    const startIndex = lowerBound(data, dateRange.start.getTime());
+    const endIndex = upperBound(data, dateRange.end.getTime());
 
-  // Calculate metrics
+    const historical: CombinedData[] = [];
+    const predicted: CombinedData[] = [];
+    for (let i = startIndex; i < endIndex; i++) {
+      const d = data[i];
+      if (d[selectedAttribute] === undefined || d[selectedAttribute] === null) continue;
+      if (d.dataType === 'Historical') historical.push(d);
+      else predicted.push(d);
+    }
+    return { filteredHistorical: historical, filteredPredicted: predicted };
+  }, [data, dateRange, selectedAttribute]);
+
+  // Calculate metrics straight from the partitions the data type filter
+  // selects — the combined view is never materialized
   const metrics = useMemo(() => {
-    if (filteredData.length === 0) {
+    const activeHistorical = dataTypeFilter === 'Predicted' ? [] : filteredHistorical;
+    const activePredicted = dataTypeFilter === 'Historical' ? [] : filteredPredicted;
+    const totalRecords = activeHistorical.length + activePredicted.length;
+
+    if (totalRecords === 0) {
       return {
         average: 0,
         max: 0,
@@ -81,35 +118,75 @@ function App() {
       };
     }
 
-    const values = filteredData.map(d => d[selectedAttribute] as number);
-    const historicalData = filteredData.filter(d => d.dataType === 'Historical');
-    const predictedData = filteredData.filter(d => d.dataType === 'Predicted');
-    
+    // Single pass per partition covers sum/min/max; the per-data-type
+    // branch disappears because each loop already knows its side
+    const accumulate = (rows: CombinedData[]) => {
+      let sum = 0;
+      let min = Infinity;
+      let max = -Infinity;
+      for (const d of rows) {
+        const value = d[selectedAttribute] as number;
+        sum += value;
+        if (value < min) min = value;
+        if (value > max) max = value;
+      }
+      return { sum, min, max, count: rows.length };
+    };
+
+    const historicalStats = accumulate(activeHistorical);
+    const predictedStats = accumulate(activePredicted);
+
     let changePercent: number | undefined;
-    if (historicalData.length > 0 && predictedData.length > 0) {
-      const historicalMean = historicalData.reduce((sum, d) => sum + (d[selectedAttribute] as number), 0) / historicalData.length;
-      const predictedMean = predictedData.reduce((sum, d) => sum + (d[selectedAttribute] as number), 0) / predictedData.length;
+    if (historicalStats.count > 0 && predictedStats.count > 0) {
+      const historicalMean = historicalStats.sum / historicalStats.count;
+      const predictedMean = predictedStats.sum / predictedStats.count;
       changePercent = ((predictedMean - historicalMean) / historicalMean) * 100;
     }
 
     const dateSpan = Math.ceil((dateRange.end.getTime() - dateRange.start.getTime()) / (1000 * 60 * 60 * 24));
 
     return {
-      average: values.reduce((a, b) => a + b, 0) / values.length,
-      max: Math.max(...values),
-      min: Math.min(...values),
-      totalRecords: filteredData.length,
-      historicalRecords: historicalData.length,
-      predictedRecords: predictedData.length,
+      average: (historicalStats.sum + predictedStats.sum) / totalRecords,
+      max: Math.max(historicalStats.max, predictedStats.max),
+      min: Math.min(historicalStats.min, predictedStats.min),
+      totalRecords,
+      historicalRecords: historicalStats.count,
+      predictedRecords: predictedStats.count,
       dateSpan,
       changePercent
     };
-  }, [filteredData, selectedAttribute, dateRange]);
+  }, [filteredHistorical, filteredPredicted, dataTypeFilter, selectedAttribute, dateRange]);
 
   // Generate insights
   const insights = useMemo(() => {
-    return generateInsights(filteredData, selectedAttribute, dataTypeFilter);
-  }, [filteredData, selectedAttribute, dataTypeFilter]);
+    return generateInsights(filteredHistorical, filteredPredicted, selectedAttribute, dataTypeFilter);
+  }, [filteredHistorical, filteredPredicted, selectedAttribute, dataTypeFilter]);
+
+  // Card definitions derive from the precomputed stats in one place,
+  // so the grid renders them in a single map
+  const metricCards = useMemo(() => [
+    {
+      title: `Average ${getAttributeLabel(selectedAttribute)}`,
+      value: metrics.average,
+      change: metrics.changePercent,
+      changeLabel: 'vs predicted'
+    },
+    {
+      title: `Max ${getAttributeLabel(selectedAttribute)}`,
+      value: metrics.max,
+      changeLabel: `Min: ${metrics.min.toFixed(2)}`
+    },
+    {
+      title: 'Total Records',
+      value: metrics.totalRecords,
+      changeLabel: `${metrics.historicalRecords} historical`
+    },
+    {
+      title: 'Date Span',
+      value: metrics.dateSpan,
+      changeLabel: 'days'
+    }
+  ], [metrics, selectedAttribute]);
 
   // Get min/max dates for date picker
   const { minDate, maxDate } = useMemo(() => {
@@ -182,33 +259,16 @@ function App() {
 
           {/* Metrics Cards */}
           <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8">
-            <MetricCard
-              title={`Average ${getAttributeLabel(selectedAttribute)}`}
-              value={metrics.average}
-              change={metrics.changePercent}
-              changeLabel="vs predicted"
-            />
-            <MetricCard
-              title={`Max ${getAttributeLabel(selectedAttribute)}`}
-              value={metrics.max}
-              changeLabel={`Min: ${metrics.min.toFixed(2)}`}
-            />
-            <MetricCard
-              title="Total Records"
-              value={metrics.totalRecords}
-              changeLabel={`${metrics.historicalRecords} historical`}
-            />
-            <MetricCard
-              title="Date Span"
-              value={metrics.dateSpan}
-              changeLabel="days"
-            />
+            {metricCards.map(card => (
+              <MetricCard key={card.title} {...card} />
+            ))}
           </div>
 
           {/* Main Chart */}
           <div className="mb-8">
             <TimeSeriesChart
-              data={filteredData}
+              historicalData={filteredHistorical}
+              predictedData={filteredPredicted}
               attribute={selectedAttribute}
               dataTypeFilter={dataTypeFilter}
             />
@@ -217,7 +277,8 @@ function App() {
           {/* Distribution Charts */}
           <div className="mb-8">
             <DistributionCharts
-              data={filteredData}
+              historicalData={filteredHistorical}
+              predictedData={filteredPredicted}
               attribute={selectedAttribute}
               dataTypeFilter={dataTypeFilter}
             />
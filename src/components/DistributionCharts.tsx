@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useMemo } from 'react';
 import {
   BarChart,
   Bar,
@@ -14,32 +14,42 @@ import { CombinedData, AttributeKey, DataTypeFilter } from '../types';
 import { getAttributeLabel, getAttributeUnit } from '../utils/insights';
 
 interface DistributionChartsProps {
-  data: CombinedData[];
+  historicalData: CombinedData[];
+  predictedData: CombinedData[];
   attribute: AttributeKey;
   dataTypeFilter: DataTypeFilter;
 }
 
-export const DistributionCharts: React.FC<DistributionChartsProps> = ({
-  data,
+export const DistributionCharts: React.FC<DistributionChartsProps> = React.memo(({
+  historicalData,
+  predictedData,
   attribute,
   dataTypeFilter
 }) => {
-  // Filter and prepare data
-  const filteredData = data
-    .filter(d => {
-      if (dataTypeFilter === 'Both') return true;
-      return d.dataType === dataTypeFilter;
-    })
-    .filter(d => d[attribute] !== undefined && d[attribute] !== null);
+  // The partitions arrive pre-filtered, so the data type filter just
+  // selects which of them take part — the combined array is never built
+  const activeHistorical = dataTypeFilter === 'Predicted' ? [] : historicalData;
+  const activePredicted = dataTypeFilter === 'Historical' ? [] : predictedData;
+  const totalCount = activeHistorical.length + activePredicted.length;
 
   // Create histogram data
   const createHistogramData = () => {
-    const values = filteredData.map(d => d[attribute] as number);
-    if (values.length === 0) return [];
+    if (totalCount === 0) return [];
 
-    const min = Math.min(...values);
-    const max = Math.max(...values);
-    const binCount = Math.min(20, Math.ceil(Math.sqrt(values.length)));
+    // One pass per partition for the bin bounds; spreading the values
+    // into Math.min/Math.max would also overflow the argument stack on
+    // long date ranges
+    let min = Infinity;
+    let max = -Infinity;
+    for (const rows of [activeHistorical, activePredicted]) {
+      for (const d of rows) {
+        const value = d[attribute] as number;
+        if (value < min) min = value;
+        if (value > max) max = value;
+      }
+    }
+
+    const binCount = Math.min(20, Math.ceil(Math.sqrt(totalCount)));
     const binWidth = (max - min) / binCount;
 
     const bins = Array.from({ length: binCount }, (_, i) => ({
@@ -50,27 +60,27 @@ export const DistributionCharts: React.FC<DistributionChartsProps> = ({
       total: 0
     }));
 
-    filteredData.forEach(d => {
-      const value = d[attribute] as number;
-      const binIndex = Math.min(Math.floor((value - min) / binWidth), binCount - 1);
-      if (binIndex >= 0 && binIndex < bins.length) {
-        bins[binIndex][d.dataType]++;
-        bins[binIndex].total++;
+    for (const rows of [activeHistorical, activePredicted]) {
+      for (const d of rows) {
+        const value = d[attribute] as number;
+        const binIndex = Math.min(Math.floor((value - min) / binWidth), binCount - 1);
+        if (binIndex >= 0 && binIndex < bins.length) {
+          bins[binIndex][d.dataType]++;
+          bins[binIndex].total++;
+        }
       }
-    });
+    }
 
     return bins;
   };
 
   // Create box plot data
   const createBoxPlotData = () => {
-    const historicalValues = filteredData
-      .filter(d => d.dataType === 'Historical')
+    const historicalValues = historicalData
       .map(d => d[attribute] as number)
       .sort((a, b) => a - b);
-    
-    const predictedValues = filteredData
-      .filter(d => d.dataType === 'Predicted')
+
+    const predictedValues = predictedData
       .map(d => d[attribute] as number)
       .sort((a, b) => a - b);
 
@@ -116,8 +126,8 @@ export const DistributionCharts: React.FC<DistributionChartsProps> = ({
     return result;
   };
 
-  const histogramData = createHistogramData();
-  const boxPlotData = createBoxPlotData();
+  const histogramData = useMemo(createHistogramData, [historicalData, predictedData, attribute, dataTypeFilter]);
+  const boxPlotData = useMemo(createBoxPlotData, [historicalData, predictedData, attribute, dataTypeFilter]);
 
   const CustomTooltip = ({ active, payload, label }: any) => {
     if (active && payload && payload.length) {
@@ -259,4 +269,4 @@ export const DistributionCharts: React.FC<DistributionChartsProps> = ({
       </div>
     </div>
   );
-};
\ No newline at end of file
+});
\ No newline at end of file
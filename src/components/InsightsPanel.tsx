@@ -7,31 +7,21 @@ interface InsightsPanelProps {
   attribute: string;
 }
 
-export const InsightsPanel: React.FC<InsightsPanelProps> = ({ insights, attribute }) => {
-  const getIcon = (type: string) => {
-    switch (type) {
-      case 'warning':
-        return <AlertTriangle className="w-5 h-5 text-amber-500" />;
-      case 'success':
-        return <CheckCircle className="w-5 h-5 text-green-500" />;
-      case 'info':
-      default:
-        return <Info className="w-5 h-5 text-blue-500" />;
-    }
-  };
+// The insight type is authoritative, so rendering is a straight lookup
+// keyed on it rather than per-insight branching
+const typeIcons: Record<InsightData['type'], React.ReactNode> = {
+  warning: <AlertTriangle className="w-5 h-5 text-amber-500" />,
+  success: <CheckCircle className="w-5 h-5 text-green-500" />,
+  info: <Info className="w-5 h-5 text-blue-500" />
+};
 
-  const getCardStyle = (type: string) => {
-    switch (type) {
-      case 'warning':
-        return 'border-amber-200 bg-amber-50';
-      case 'success':
-        return 'border-green-200 bg-green-50';
-      case 'info':
-      default:
-        return 'border-blue-200 bg-blue-50';
-    }
-  };
+const typeCardStyles: Record<InsightData['type'], string> = {
+  warning: 'border-amber-200 bg-amber-50',
+  success: 'border-green-200 bg-green-50',
+  info: 'border-blue-200 bg-blue-50'
+};
 
+export const InsightsPanel: React.FC<InsightsPanelProps> = ({ insights, attribute }) => {
   if (insights.length === 0) {
     return (
       <div className="bg-white rounded-xl shadow-sm border border-gray-100 p-6">
@@ -64,11 +54,11 @@ export const InsightsPanel: React.FC<InsightsPanelProps> = ({ insights, attribut
         {insights.map((insight, index) => (
           <div
             key={index}
-            className={`border rounded-lg p-4 ${getCardStyle(insight.type)}`}
+            className={`border rounded-lg p-4 ${typeCardStyles[insight.type] ?? typeCardStyles.info}`}
           >
             <div className="flex items-start space-x-3">
               <div className="flex-shrink-0 mt-0.5">
-                {getIcon(insight.type)}
+                {typeIcons[insight.type] ?? typeIcons.info}
               </div>
               <div className="flex-1">
                 <p className="text-sm text-gray-800 leading-relaxed">
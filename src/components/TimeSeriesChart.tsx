@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useMemo } from 'react';
 import {
   LineChart,
   Line,
@@ -12,34 +12,88 @@ import {
 import { format } from 'date-fns';
 import { CombinedData, AttributeKey, DataTypeFilter } from '../types';
 import { getAttributeLabel, getAttributeUnit } from '../utils/insights';
+import { downsampleLTTB } from '../utils/downsample';
 
 interface TimeSeriesChartProps {
-  data: CombinedData[];
+  historicalData: CombinedData[];
+  predictedData: CombinedData[];
   attribute: AttributeKey;
   dataTypeFilter: DataTypeFilter;
 }
 
-export const TimeSeriesChart: React.FC<TimeSeriesChartProps> = ({
-  data,
+interface ChartPoint {
+  datetime: number;
+  value: number;
+  dataType: 'Historical' | 'Predicted';
+  Historical: number | null;
+  Predicted: number | null;
+}
+
+// Recently built chart datasets keyed by the selection that produced
+// them, so flipping back to a just-viewed attribute/filter/range reuses
+// the downsampled points instead of rebuilding them. useMemo only holds
+// the latest result; this keeps the last few.
+const CHART_CACHE_MAX_ENTRIES = 32;
+const chartDataCache = new Map<string, ChartPoint[]>();
+
+const selectionKey = (
+  historicalData: CombinedData[],
+  predictedData: CombinedData[],
+  attribute: AttributeKey,
+  dataTypeFilter: DataTypeFilter
+): string => {
+  // Lengths plus first/last timestamps fingerprint the partitions
+  // without hashing every row
+  const edges = (rows: CombinedData[]) => rows.length === 0
+    ? '0'
+    : `${rows.length}:${rows[0].datetime.getTime()}:${rows[rows.length - 1].datetime.getTime()}`;
+  return `${attribute}|${dataTypeFilter}|${edges(historicalData)}|${edges(predictedData)}`;
+};
+
+export const TimeSeriesChart: React.FC<TimeSeriesChartProps> = React.memo(({
+  historicalData,
+  predictedData,
   attribute,
   dataTypeFilter
 }) => {
-  // Prepare chart data
-  const chartData = data
-    .filter(d => {
-      if (dataTypeFilter === 'Both') return true;
-      return d.dataType === dataTypeFilter;
-    })
-    .filter(d => d[attribute] !== undefined && d[attribute] !== null)
-    .map(d => ({
+  // Prepare chart data; memoized so unrelated re-renders skip the
+  // map/downsample pipeline entirely. The partitions arrive pre-filtered
+  // and sorted, so the filter just selects which series to draw.
+  const chartData = useMemo(() => {
+    const cacheKey = selectionKey(historicalData, predictedData, attribute, dataTypeFilter);
+    const cached = chartDataCache.get(cacheKey);
+    if (cached) {
+      // Re-insert to mark as most recently used
+      chartDataCache.delete(cacheKey);
+      chartDataCache.set(cacheKey, cached);
+      return cached;
+    }
+
+    // No per-point label strings: the tooltip and axis format the
+    // timestamp on demand, so only the hovered point ever pays for it
+    const toPoint = (d: CombinedData): ChartPoint => ({
       datetime: d.datetime.getTime(),
-      dateLabel: format(d.datetime, 'MMM dd, HH:mm'),
       value: d[attribute] as number,
       dataType: d.dataType,
       Historical: d.dataType === 'Historical' ? d[attribute] as number : null,
       Predicted: d.dataType === 'Predicted' ? d[attribute] as number : null,
-    }))
-    .sort((a, b) => a.datetime - b.datetime);
+    });
+
+    // Downsample each series independently so the historical/predicted lines
+    // keep their shape instead of stealing each other's bucket slots
+    const historicalPoints = dataTypeFilter === 'Predicted' ? [] : historicalData.map(toPoint);
+    const predictedPoints = dataTypeFilter === 'Historical' ? [] : predictedData.map(toPoint);
+    const points = [
+      ...downsampleLTTB(historicalPoints, p => p.datetime, p => p.value),
+      ...downsampleLTTB(predictedPoints, p => p.datetime, p => p.value),
+    ].sort((a, b) => a.datetime - b.datetime);
+
+    if (chartDataCache.size >= CHART_CACHE_MAX_ENTRIES) {
+      chartDataCache.delete(chartDataCache.keys().next().value as string);
+    }
+    chartDataCache.set(cacheKey, points);
+    return points;
+  }, [historicalData, predictedData, attribute, dataTypeFilter]);
 
   const CustomTooltip = ({ active, payload, label }: any) => {
     if (active && payload && payload.length) {
@@ -61,9 +115,9 @@ export const TimeSeriesChart: React.FC<TimeSeriesChartProps> = ({
     return null;
   };
 
-  const shouldShowBothLines = dataTypeFilter === 'Both' && 
-    data.some(d => d.dataType === 'Historical') && 
-    data.some(d => d.dataType === 'Predicted');
+  const shouldShowBothLines = dataTypeFilter === 'Both' &&
+    historicalData.length > 0 &&
+    predictedData.length > 0;
 
   return (
     <div className="bg-white rounded-xl shadow-sm border border-gray-100 p-6">
@@ -111,6 +165,7 @@ export const TimeSeriesChart: React.FC<TimeSeriesChartProps> = ({
                   strokeWidth={2}
                   dot={false}
                   connectNulls={false}
+                  isAnimationActive={false}
                   name="Historical Data"
                 />
                 <Line
@@ -121,6 +176,7 @@ export const TimeSeriesChart: React.FC<TimeSeriesChartProps> = ({
                   strokeDasharray="5 5"
                   dot={false}
                   connectNulls={false}
+                  isAnimationActive={false}
                   name="Predicted Data"
                 />
               </>
@@ -132,6 +188,7 @@ export const TimeSeriesChart: React.FC<TimeSeriesChartProps> = ({
                 strokeWidth={2}
                 strokeDasharray={dataTypeFilter === 'Predicted' ? '5 5' : '0'}
                 dot={false}
+                isAnimationActive={false}
                 name={`${dataTypeFilter} Data`}
               />
             )}
@@ -140,4 +197,4 @@ export const TimeSeriesChart: React.FC<TimeSeriesChartProps> = ({
       </div>
     </div>
   );
-};
\ No newline at end of file
+});
\ No newline at end of file
@@ -1,8 +1,14 @@
 import { StrictMode } from 'react';
 import { createRoot } from 'react-dom/client';
 import App from './App.tsx';
+import { loadCSVData } from './utils/csvParser';
 import './index.css';
 
+// Warm the data cache at boot: kicking off the fetch + parse now lets it
+// overlap React mounting, so App's load effect resolves from the shared
+// module-level promise instead of starting cold
+loadCSVData();
+
 createRoot(document.getElementById('root')!).render(
   <StrictMode>
     <App />
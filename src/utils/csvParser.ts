@@ -46,8 +46,10 @@ export const processPatientData = (rawData: any[], dataType: 'Historical' | 'Pre
       datetime = new Date(baseDate.getTime() + (index * 60 * 60 * 1000));
     }
 
+    // Keep only the typed fields rather than spreading the raw row:
+    // every record gets the same compact shape, and unused CSV columns
+    // don't ride along through filtering, charting, and insights
     return {
-      ...row,
       datetime,
       dataType,
       StressIndex: typeof row.StressIndex === 'number' ? row.StressIndex : undefined,
@@ -58,32 +60,57 @@ export const processPatientData = (rawData: any[], dataType: 'Historical' | 'Pre
   });
 };
 
-export const loadCSVData = async (): Promise<CombinedData[]> => {
-  try {
-    // Try to load the actual CSV files
-    const [historicalResponse, predictedResponse] = await Promise.all([
-      fetch('/data/patient_180days_hourly.csv'),
-      fetch('/data/Prediction_with_StressIndex.csv')
-    ]);
+// Cache the fully parsed, typed rows at module scope so the fetch + Papa
+// parse + Date conversion cost is paid once per session instead of once
+// per caller. The CSV files are static assets, so the cache never goes
+// stale within a page load.
+let loadPromise: Promise<CombinedData[]> | null = null;
 
-    if (historicalResponse.ok && predictedResponse.ok) {
-      const [historicalText, predictedText] = await Promise.all([
-        historicalResponse.text(),
-        predictedResponse.text()
-      ]);
+export const loadCSVData = (): Promise<CombinedData[]> => {
+  if (!loadPromise) {
+    loadPromise = fetchAndParseData();
+  }
+  return loadPromise;
+};
 
-      const [historicalRaw, predictedRaw] = await Promise.all([
-        parseCSV(historicalText),
-        parseCSV(predictedText)
-      ]);
+const HISTORICAL_URL = '/data/patient_180days_hourly.csv';
+const PREDICTION_URL = '/data/Prediction_with_StressIndex.csv';
 
-      const historicalData = processPatientData(historicalRaw, 'Historical');
-      const predictedData = processPatientData(predictedRaw, 'Predicted');
+// Parsed rows cached per file: the historical snapshot is immutable, so
+// refreshing the combined dataset only re-reads the smaller prediction
+// file instead of re-parsing the 180-day bulk
+const fileCache = new Map<string, Promise<CombinedData[]>>();
 
-      return [...historicalData, ...predictedData].sort((a, b) => 
-        a.datetime.getTime() - b.datetime.getTime()
-      );
-    }
+const loadFile = async (url: string, dataType: 'Historical' | 'Predicted'): Promise<CombinedData[]> => {
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch ${url}: ${response.status}`);
+  }
+  const rawData = await parseCSV(await response.text());
+  return processPatientData(rawData, dataType);
+};
+
+const loadFileCached = (url: string, dataType: 'Historical' | 'Predicted'): Promise<CombinedData[]> => {
+  let cached = fileCache.get(url);
+  if (!cached) {
+    cached = loadFile(url, dataType);
+    // Drop failed loads so a later refresh can retry them
+    cached.catch(() => fileCache.delete(url));
+    fileCache.set(url, cached);
+  }
+  return cached;
+};
+
+const fetchAndParseData = async (): Promise<CombinedData[]> => {
+  try {
+    const [historicalData, predictedData] = await Promise.all([
+      loadFileCached(HISTORICAL_URL, 'Historical'),
+      loadFileCached(PREDICTION_URL, 'Predicted')
+    ]);
+
+    return [...historicalData, ...predictedData].sort((a, b) =>
+      a.datetime.getTime() - b.datetime.getTime()
+    );
   } catch (error) {
     console.warn('Could not load CSV files, generating sample data:', error);
   }
@@ -92,7 +119,22 @@ export const loadCSVData = async (): Promise<CombinedData[]> => {
   return generateSampleData();
 };
 
+// Re-read only the prediction file and rebuild the combined view; the
+// cached historical rows are reused as-is
+export const refreshPredictions = (): Promise<CombinedData[]> => {
+  fileCache.delete(PREDICTION_URL);
+  loadPromise = null;
+  return loadCSVData();
+};
+
+// Generated once and reused: the fallback builds 270 days of hourly
+// rows with random noise, so regenerating it would both repeat the work
+// and hand callers a different dataset each time
+let sampleDataCache: CombinedData[] | null = null;
+
 const generateSampleData = (): CombinedData[] => {
+  if (sampleDataCache) return sampleDataCache;
+
   const data: CombinedData[] = [];
   const now = new Date();
   
@@ -131,6 +173,7 @@ const generateSampleData = (): CombinedData[] => {
       DiastolicBP: Math.max(60, Math.min(120, baseDiastolic + (Math.random() - 0.5) * 12)),
     });
   }
-  
+
+  sampleDataCache = data;
   return data;
 };
\ No newline at end of file
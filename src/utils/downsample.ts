@@ -0,0 +1,81 @@
+// Largest-Triangle-Three-Buckets downsampling for time series charts.
+// The browser canvas only has ~2000 horizontal pixels, so rendering every
+// hourly point (180*24 historical + 90*24 predicted) is wasted work for
+// Recharts. LTTB picks the visually most significant point per bucket,
+// preserving peaks and overall shape while capping the point count.
+
+export const MAX_CHART_POINTS = 2000;
+
+// Index-selecting kernel over flat numeric buffers. Copying x/y into
+// typed arrays once keeps the triangle-area loop on contiguous doubles
+// with a preallocated output, instead of calling accessors and chasing
+// object properties for every candidate point.
+const lttbIndices = (x: Float64Array, y: Float64Array, threshold: number): Int32Array => {
+  const n = x.length;
+  const out = new Int32Array(threshold);
+  const bucketSize = (n - 2) / (threshold - 2);
+  let selectedIndex = 0;
+
+  out[0] = 0;
+  for (let i = 0; i < threshold - 2; i++) {
+    // Average point of the next bucket forms the third triangle vertex
+    const nextStart = Math.floor((i + 1) * bucketSize) + 1;
+    const nextEnd = Math.min(Math.floor((i + 2) * bucketSize) + 1, n);
+    let avgX = 0;
+    let avgY = 0;
+    for (let j = nextStart; j < nextEnd; j++) {
+      avgX += x[j];
+      avgY += y[j];
+    }
+    const nextCount = Math.max(nextEnd - nextStart, 1);
+    avgX /= nextCount;
+    avgY /= nextCount;
+
+    // Pick the point in the current bucket forming the largest triangle
+    // with the previously selected point and the next bucket's average
+    const currStart = Math.floor(i * bucketSize) + 1;
+    const currEnd = Math.min(Math.floor((i + 1) * bucketSize) + 1, n);
+    const ax = x[selectedIndex];
+    const ay = y[selectedIndex];
+
+    let maxArea = -1;
+    let maxIndex = currStart;
+    for (let j = currStart; j < currEnd; j++) {
+      const area = Math.abs((ax - avgX) * (y[j] - ay) - (ax - x[j]) * (avgY - ay));
+      if (area > maxArea) {
+        maxArea = area;
+        maxIndex = j;
+      }
+    }
+
+    out[i + 1] = maxIndex;
+    selectedIndex = maxIndex;
+  }
+  out[threshold - 1] = n - 1;
+
+  return out;
+};
+
+export const downsampleLTTB = <T>(
+  points: T[],
+  getX: (point: T) => number,
+  getY: (point: T) => number,
+  threshold: number = MAX_CHART_POINTS
+): T[] => {
+  const n = points.length;
+  if (threshold >= n || threshold < 3) return points;
+
+  const x = new Float64Array(n);
+  const y = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    x[i] = getX(points[i]);
+    y[i] = getY(points[i]);
+  }
+
+  const indices = lttbIndices(x, y, threshold);
+  const sampled: T[] = new Array(threshold);
+  for (let i = 0; i < threshold; i++) {
+    sampled[i] = points[indices[i]];
+  }
+  return sampled;
+};
@@ -1,29 +1,47 @@
 import { CombinedData, InsightData, AttributeKey, DataTypeFilter } from '../types';
 
 export const generateInsights = (
-  data: CombinedData[],
+  historicalData: CombinedData[],
+  predictedData: CombinedData[],
   attribute: AttributeKey,
   dataTypeFilter: DataTypeFilter
 ): InsightData[] => {
   const insights: InsightData[] = [];
-  
-  if (data.length === 0) return insights;
 
-  // Filter data based on attribute availability
-  const validData = data.filter(d => d[attribute] !== undefined && d[attribute] !== null);
-  
+  // The partitions arrive pre-filtered for the attribute, so selecting
+  // the working set is a dispatch rather than another scan
+  const validData =
+    dataTypeFilter === 'Historical' ? historicalData :
+    dataTypeFilter === 'Predicted' ? predictedData :
+    [...historicalData, ...predictedData];
+
   if (validData.length === 0) return insights;
 
+  // One moment pass per active partition feeds both the change
+  // percentage and the variability insight below
+  const computeMoments = (rows: CombinedData[]) => {
+    let sum = 0;
+    let sumSquares = 0;
+    for (const d of rows) {
+      const value = d[attribute] as number;
+      sum += value;
+      sumSquares += value * value;
+    }
+    return { sum, sumSquares, count: rows.length };
+  };
+
+  const historicalMoments = computeMoments(dataTypeFilter === 'Predicted' ? [] : historicalData);
+  const predictedMoments = computeMoments(dataTypeFilter === 'Historical' ? [] : predictedData);
+
   // Compare historical vs predicted if both are available
   if (dataTypeFilter === 'Both') {
-    const historicalData = validData.filter(d => d.dataType === 'Historical');
-    const predictedData = validData.filter(d => d.dataType === 'Predicted');
-    
-    if (historicalData.length > 0 && predictedData.length > 0) {
-      const historicalMean = historicalData.reduce((sum, d) => sum + (d[attribute] as number), 0) / historicalData.length;
-      const predictedMean = predictedData.reduce((sum, d) => sum + (d[attribute] as number), 0) / predictedData.length;
-      
-      const changePercent = ((predictedMean - historicalMean) / historicalMean) * 100;
+    if (historicalMoments.count > 0 && predictedMoments.count > 0) {
+      const historicalMean = historicalMoments.sum / historicalMoments.count;
+      const predictedMean = predictedMoments.sum / predictedMoments.count;
+
+      const changePercent = Math.abs(historicalMean) < 1e-9
+        ? 0
+        : ((predictedMean - historicalMean) / historicalMean) * 100;
       
       if (changePercent > 10) {
         insights.push({
@@ -49,19 +67,49 @@ export const generateInsights = (
 
   // Trend analysis
   if (validData.length > 1) {
-    const values = validData.map(d => d[attribute] as number);
-    const timePoints = validData.map((_, index) => index);
-    
-    // Simple linear regression to detect trend
-    const n = values.length;
-    const sumX = timePoints.reduce((a, b) => a + b, 0);
-    const sumY = values.reduce((a, b) => a + b, 0);
-    const sumXY = timePoints.reduce((sum, x, i) => sum + x * values[i], 0);
-    const sumXX = timePoints.reduce((sum, x) => sum + x * x, 0);
-    
+    // Aggregate the hourly samples to daily means before fitting: the
+    // slope sign only needs representative points, not every raw sample,
+    // and daily averaging keeps noisy hours from flipping it on long
+    // horizons
+    const dayMs = 24 * 60 * 60 * 1000;
+    const dailyBuckets = new Map<number, { sum: number; count: number }>();
+    for (const d of validData) {
+      const day = Math.floor(d.datetime.getTime() / dayMs);
+      const bucket = dailyBuckets.get(day);
+      if (bucket) {
+        bucket.sum += d[attribute] as number;
+        bucket.count++;
+      } else {
+        dailyBuckets.set(day, { sum: d[attribute] as number, count: 1 });
+      }
+    }
+
+    // Rows are chronological, so the map preserves day order; fall back
+    // to the raw values when the range is too short to aggregate
+    const series = dailyBuckets.size > 2
+      ? Array.from(dailyBuckets.values(), b => b.sum / b.count)
+      : validData.map(d => d[attribute] as number);
+
+    // Simple linear regression to detect trend. The x values are just
+    // 0..n-1, so their sums have closed forms and only the y sums need
+    // a pass over the series.
+    const n = series.length;
+    const sumX = (n * (n - 1)) / 2;
+    const sumXX = ((n - 1) * n * (2 * n - 1)) / 6;
+    let sumY = 0;
+    let sumXY = 0;
+    for (let i = 0; i < n; i++) {
+      sumY += series[i];
+      sumXY += i * series[i];
+    }
+
     const slope = (n * sumXY - sumX * sumY) / (n * sumXX - sumX * sumX);
-    
-    if (Math.abs(slope) > 0.01) {
+
+    // Scale the stability threshold by the aggregation factor so the
+    // per-day slope keeps the same semantics as the old per-sample fit
+    const slopeThreshold = 0.01 * (validData.length / n);
+
+    if (Math.abs(slope) > slopeThreshold) {
       if (slope > 0) {
         insights.push({
           type: 'info',
@@ -84,10 +132,12 @@ export const generateInsights = (
     }
   }
 
-  // Variability analysis
-  const values = validData.map(d => d[attribute] as number);
-  const mean = values.reduce((a, b) => a + b, 0) / values.length;
-  const variance = values.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) / values.length;
+  // Variability analysis: pool the partition moments instead of
+  // re-scanning the values
+  const total = historicalMoments.sum + predictedMoments.sum;
+  const totalSquares = historicalMoments.sumSquares + predictedMoments.sumSquares;
+  const mean = total / validData.length;
+  const variance = Math.max(totalSquares / validData.length - mean * mean, 0);
   const stdDev = Math.sqrt(variance);
   const coefficientOfVariation = (stdDev / mean) * 100;
 
@@ -112,6 +162,7 @@ export const generateInsights = (
   }
 
   // Outlier detection
+  const values = validData.map(d => d[attribute] as number);
   const q1 = values.sort((a, b) => a - b)[Math.floor(values.length * 0.25)];
   const q3 = values[Math.floor(values.length * 0.75)];
   const iqr = q3 - q1;